@@ -11,6 +11,9 @@ Usage:
     cd benchmarks/visualize
     pip install -r requirements.txt
     python3 generate_graphs.py
+    python3 generate_graphs.py --only table,dashboard   # skip the figures
+    python3 generate_graphs.py --draft                  # quick low-res PNGs
+    python3 generate_graphs.py --jobs 4                 # figure worker processes
 
 Outputs (in ./figures/):
     Fig 01 — issuance_latency.pdf/.png
@@ -27,25 +30,26 @@ Outputs (in ./figures/):
     summary_table.tex — LaTeX table for the paper
 """
 
-import json, glob, os, sys
+import argparse, fnmatch, json, os, sys
+from string import Template
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-from matplotlib.gridspec import GridSpec
-from scipy import stats as scipy_stats
-
-# ── optional HTML dashboard ──────────────────────────────────────────────────
+
+# ── optional fast JSON ───────────────────────────────────────────────────────
+# orjson parses the float-heavy result files several times faster than the
+# stdlib; Plotly also picks it up automatically for the dashboard payload.
 try:
-    import plotly.graph_objects as go
-    import plotly.subplots as psp
-    HAS_PLOTLY = True
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    HAS_PLOTLY = False
+    _json_loads = json.loads
+
+# Matplotlib and Plotly are imported on first use (see _mpl / write_dashboard)
+# so that `--only table` and friends skip their import cost entirely.
 
 # ── paths ─────────────────────────────────────────────────────────────────────
 HERE       = Path(__file__).parent
@@ -74,7 +78,6 @@ PAPER_STYLE = {
     "lines.linewidth":   2,
     "lines.markersize":  7,
 }
-plt.rcParams.update(PAPER_STYLE)
 
 COLORS = {
     "seq":   "#7c3aed",
@@ -87,21 +90,88 @@ COLORS = {
 }
 MARKERS = ["o", "s", "^", "D", "v", "P"]
 
+OUTPUTS = ("figures", "table", "dashboard")
+
+# Scatter plots with more points than this are rasterized in the PDF output.
+# A vector scatter costs ~16 KB per 1k markers against a ~500 KB raster, so
+# below ~30k markers vector is smaller (though slower to write); above it the
+# raster wins on both size and time.
+RASTERIZE_ABOVE = 30_000
+
+# PNG zlib level and resolution.  --draft switches to the DRAFT_* values:
+# ~3x faster to encode and far fewer pixels; the PDFs are unaffected.
+PNG_COMPRESS       = 6
+DRAFT_PNG_COMPRESS = 1
+DRAFT_PNG_DPI      = 120
+DRAFT = False
+
+# CDF curves are downsampled (LTTB) to at most this many vertices.
+CDF_MAX_POINTS = 500
+
 # ── helpers ───────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
+def _mpl():
+    """Import pyplot + ticker once, on the Agg backend with the paper style."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as ticker
+    plt.rcParams.update(PAPER_STYLE)
+    return plt, ticker
+
+@lru_cache(maxsize=None)
+def _result_names():
+    """File names in RESULTS_DIR, listed once per run with a single scandir."""
+    try:
+        with os.scandir(RESULTS_DIR) as it:
+            return tuple(e.name for e in it if e.is_file())
+    except FileNotFoundError:
+        return ()
+
 def load_latest(pattern):
-    files = sorted(glob.glob(str(RESULTS_DIR / pattern)))
-    if not files:
+    # Result files are named by timestamp, so the newest run is the
+    # lexicographic max -- one pass, no sort.  (Not mtime: a fresh git
+    # checkout gives every file the same one.)
+    name = max(fnmatch.filter(_result_names(), pattern), default=None)
+    if name is None:
         return None
-    with open(files[-1]) as f:
-        return json.load(f)
+    return _json_loads((RESULTS_DIR / name).read_bytes())
+
+def _init_worker(draft):
+    """ProcessPoolExecutor initializer: carry CLI render settings into workers.
+
+    Also sets up pyplot and the font cache before the first task.  Under fork
+    main() has already done so and this is a cache hit; under spawn each
+    worker pays it once up front rather than inside its first figure.
+    """
+    global DRAFT
+    DRAFT = draft
+    _mpl()
 
 def savefig(fig, name, dpi=200):
-    for ext in ("png", "pdf"):
-        path = FIGURES_DIR / f"{name}.{ext}"
-        fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    # bbox_inches="tight" costs a full dry-run draw per format; lay the figure
+    # out once at the output dpi and hand the same box to both writers.
+    plt, _ = _mpl()
+    fig.set_dpi(dpi)
+    fig.draw_without_rendering()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(plt.rcParams["savefig.pad_inches"])
+    fig.savefig(FIGURES_DIR / f"{name}.png", dpi=DRAFT_PNG_DPI if DRAFT else dpi, bbox_inches=bbox,
+                pil_kwargs={"compress_level": DRAFT_PNG_COMPRESS if DRAFT else PNG_COMPRESS})
+    fig.savefig(FIGURES_DIR / f"{name}.pdf", dpi=dpi, bbox_inches=bbox,
+                metadata={"CreationDate": None})
     print(f"  Saved: figures/{name}.png  +  .pdf")
 
+def write_if_changed(path, text):
+    """Write text to path unless it already holds exactly that; True if written."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(text, encoding="utf-8")
+    return True
+
 def fmt_n(n):
     if n >= 10_000: return "10k"
     if n >= 1_000:  return f"{n//1000}k"
@@ -110,42 +180,154 @@ def fmt_n(n):
 def pct(arr, p):
     return float(np.percentile(arr, p))
 
-def cdf(data):
-    s = np.sort(data)
+def columns(rows, *getters):
+    """Walk rows once, returning one float64 array per getter (unpackable)."""
+    cols = np.empty((len(getters), len(rows)))
+    for j, r in enumerate(rows):
+        for i, get in enumerate(getters):
+            cols[i, j] = get(r)
+    return cols
+
+def latency_columns(rows):
+    """n, mean, p50, p95, p99 columns of a sequential latency suite."""
+    return columns(rows,
+                   lambda r: r["n"],
+                   lambda r: r.get("mean", 0),
+                   lambda r: r.get("median", r.get("p50", 0)),
+                   lambda r: r.get("p95", 0),
+                   lambda r: r.get("p99", 0))
+
+def rolling_mean(a, window):
+    """Trailing mean of a[max(0, i-window) : i+1] for every i, via one cumsum."""
+    c  = np.concatenate(([0.0], np.cumsum(a)))
+    hi = np.arange(1, len(a)+1)
+    lo = np.maximum(0, hi - 1 - window)
+    return (c[hi] - c[lo]) / (hi - lo)
+
+def sorted_samples(rows):
+    """Per-row sorted float64 times_ms arrays (None where a row has no samples)."""
+    return [np.sort(np.asarray(r["times_ms"], dtype=np.float64)) if r.get("times_ms") else None
+            for r in rows]
+
+def cdf(s):
+    """Empirical CDF of already-sorted samples."""
     y = np.arange(1, len(s)+1) / len(s)
     return s, y
 
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsample of (x, y) to n_out points.
+
+    Keeps the first and last points and, from each interior bucket, the point
+    forming the largest triangle with the previously kept point and the mean
+    of the next bucket.  Returns the input unchanged if it is already small.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i+1]
+        if i + 2 < len(edges):
+            nx, ny = x[hi:edges[i+2]].mean(), y[hi:edges[i+2]].mean()
+        else:
+            nx, ny = x[-1], y[-1]
+        area = np.abs((x[a] - nx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (ny - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i+1] = a
+    return x[idx], y[idx]
+
 # ── load data ─────────────────────────────────────────────────────────────────
 
-iss  = load_latest("issuance_*.json")
-ver  = load_latest("verification_*.json")
-# Use the log-matched run files for concurrent and throughput
-conc = load_latest("concurrent_2026-03-06T19-59-20-777Z.json") or load_latest("concurrent_*.json")
-thr  = load_latest("throughput_2026-03-06T20-00-42-345Z.json") or load_latest("throughput_*.json")
+def load_suites():
+    iss  = load_latest("issuance_*.json")
+    ver  = load_latest("verification_*.json")
+    # Use the log-matched run files for concurrent and throughput
+    conc = load_latest("concurrent_2026-03-06T19-59-20-777Z.json") or load_latest("concurrent_*.json")
+    thr  = load_latest("throughput_2026-03-06T20-00-42-345Z.json") or load_latest("throughput_*.json")
+    return {"iss": iss, "ver": ver, "conc": conc, "thr": thr}
+
+# ── shared series ─────────────────────────────────────────────────────────────
+# Figs 1–4 and the dashboard all plot these; extract them once per run, one
+# pass over each suite's rows.
+
+def shared_series(d):
+    iss, ver, conc, thr = d["iss"], d["ver"], d["conc"], d["thr"]
+
+    d["iss_seq"] = latency_columns(iss["sequential"]) if iss and iss.get("sequential") else None
+    d["ver_seq"] = latency_columns(ver["sequential"]) if ver and ver.get("sequential") else None
 
-available = {k: v for k, v in [("iss", iss), ("ver", ver), ("conc", conc), ("thr", thr)] if v}
-print(f"\nLoaded benchmark files: {list(available.keys())}")
-if not available:
-    print("ERROR: No result JSON files found in benchmarks/results/")
-    print("Run: node benchmarks/run.js  first.")
-    sys.exit(1)
+    # Raw latency samples, sorted once for both the CDFs (Fig 5) and box plots (Fig 7)
+    d["iss_seq_sorted"] = sorted_samples(iss["sequential"]) if iss and iss.get("sequential") else []
+    d["ver_seq_sorted"] = sorted_samples(ver["sequential"]) if ver and ver.get("sequential") else []
+
+    # (n, throughput, wall_ms) columns, or None when the suite is missing
+    d["iss_par"] = None
+    if iss and iss.get("parallel"):
+        d["iss_par"] = columns(
+            iss["parallel"],
+            lambda r: r["n"],
+            lambda r: r.get("throughput_cps", {}).get("mean", 0),
+            lambda r: r.get("wall_ms", {}).get("mean", 0))
+
+    d["ver_con"] = None
+    if ver and ver.get("concurrent"):
+        d["ver_con"] = columns(
+            ver["concurrent"],
+            lambda r: r["n"],
+            lambda r: r.get("throughput_qps", {}).get("mean", 0),
+            lambda r: r.get("wall_ms", {}).get("mean", 0))
+
+    d["conc_con"] = None
+    if conc and conc.get("concurrent"):
+        d["conc_con"] = columns(
+            conc["concurrent"],
+            lambda r: r["c"],
+            lambda r: r.get("throughput_ops", {}).get("mean", 0),
+            lambda r: r.get("wall_ms", {}).get("mean", 0))
+
+    # (db_size, throughput, batch_wall_ms) per Merkle growth step (Fig 6 + dashboard)
+    d["merkle"] = None
+    if thr and thr.get("merkle_growth"):
+        d["merkle"] = columns(
+            thr["merkle_growth"],
+            lambda r: r["db_size_after"],
+            lambda r: r["throughput_cps"],
+            lambda r: r["batch_wall_ms"])
+
+    # Sustained-load trace (Fig 8): seconds since start and per-call latency
+    d["sus_trace"] = None
+    sus = (thr or {}).get("sustained") or {}
+    if sus.get("timestamps_ms") and sus.get("times_ms"):
+        d["sus_trace"] = (np.asarray(sus["timestamps_ms"], dtype=np.float64) / 1000,
+                          np.asarray(sus["times_ms"], dtype=np.float64))
+
+    # (window_start_s, throughput) per 10 s window (Fig 8 + dashboard)
+    d["sus_windows"] = None
+    if sus.get("throughput_windows"):
+        d["sus_windows"] = columns(
+            sus["throughput_windows"],
+            lambda w: w["window_start_s"],
+            lambda w: w["throughput_cps"])
+    return d
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Figure 1  —  Issuance Latency vs N
 # ═════════════════════════════════════════════════════════════════════════════
 
-if iss:
+def fig01_issuance_latency(d):
+    if not d["iss"]:
+        return
+    plt, ticker = _mpl()
     print("\nFig 01: Issuance latency …")
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
 
     # Left panel: sequential latency vs N
     ax = axes[0]
-    if iss.get("sequential"):
-        ns   = [r["n"] for r in iss["sequential"]]
-        mns  = [r.get("mean", 0) for r in iss["sequential"]]
-        p50s = [r.get("median", r.get("p50", 0)) for r in iss["sequential"]]
-        p95s = [r.get("p95", 0) for r in iss["sequential"]]
-        p99s = [r.get("p99", 0) for r in iss["sequential"]]
+    if d["iss_seq"] is not None:
+        ns, mns, p50s, p95s, p99s = d["iss_seq"]
         ax.plot(ns, mns,  "o-", color=COLORS["seq"], label="Mean",   zorder=3)
         ax.plot(ns, p50s, "s--",color=COLORS["seq"], alpha=0.7, label="p50",  zorder=3)
         ax.plot(ns, p95s, "^-.", color=COLORS["par"], alpha=0.7, label="p95",  zorder=3)
@@ -159,10 +341,8 @@ if iss:
 
     # Right panel: parallel throughput vs N
     ax = axes[1]
-    if iss.get("parallel"):
-        ns  = [r["n"] for r in iss["parallel"]]
-        cps = [r.get("throughput_cps", {}).get("mean", 0) for r in iss["parallel"]]
-        wls = [r.get("wall_ms", {}).get("mean", 0) for r in iss["parallel"]]
+    if d["iss_par"] is not None:
+        ns, cps, wls = d["iss_par"]
         ax2 = ax.twinx()
         l1, = ax.plot(ns, cps, "o-", color=COLORS["par"], label="Throughput (certs/s)", zorder=3)
         l2, = ax2.plot(ns, wls, "s--", color=COLORS["seq"], alpha=0.7, label="Wall time (ms)", zorder=3)
@@ -182,17 +362,16 @@ if iss:
 # Figure 2  —  Verification Latency vs N
 # ═════════════════════════════════════════════════════════════════════════════
 
-if ver:
+def fig02_verification_latency(d):
+    if not d["ver"]:
+        return
+    plt, ticker = _mpl()
     print("Fig 02: Verification latency …")
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
 
     ax = axes[0]
-    if ver.get("sequential"):
-        ns   = [r["n"] for r in ver["sequential"]]
-        mns  = [r.get("mean", 0) for r in ver["sequential"]]
-        p50s = [r.get("median", r.get("p50", 0)) for r in ver["sequential"]]
-        p95s = [r.get("p95", 0) for r in ver["sequential"]]
-        p99s = [r.get("p99", 0) for r in ver["sequential"]]
+    if d["ver_seq"] is not None:
+        ns, mns, p50s, p95s, p99s = d["ver_seq"]
         ax.plot(ns, mns,  "o-", color=COLORS["ver"],   label="Mean")
         ax.plot(ns, p50s, "s--",color=COLORS["ver"],   alpha=0.7, label="p50")
         ax.plot(ns, p95s, "^-.",color=COLORS["par"],   alpha=0.7, label="p95")
@@ -205,10 +384,8 @@ if ver:
     ax.legend()
 
     ax = axes[1]
-    if ver.get("concurrent"):
-        ns  = [r["n"] for r in ver["concurrent"]]
-        qps = [r.get("throughput_qps", {}).get("mean", 0) for r in ver["concurrent"]]
-        wls = [r.get("wall_ms", {}).get("mean", 0) for r in ver["concurrent"]]
+    if d["ver_con"] is not None:
+        ns, qps, wls = d["ver_con"]
         ax2 = ax.twinx()
         l1, = ax.plot(ns, qps, "o-", color=COLORS["ver"], label="Throughput (queries/s)")
         l2, = ax2.plot(ns, wls, "s--", color=COLORS["par"], alpha=0.7, label="Wall time (ms)")
@@ -228,51 +405,52 @@ if ver:
 # Figure 3  —  Throughput Comparison (all operations on one chart)
 # ═════════════════════════════════════════════════════════════════════════════
 
-print("Fig 03: Throughput comparison …")
-fig, ax = plt.subplots(figsize=(9, 5))
-
-if iss and iss.get("parallel"):
-    ns  = [r["n"] for r in iss["parallel"]]
-    cps = [r.get("throughput_cps", {}).get("mean", 0) for r in iss["parallel"]]
-    ax.plot(ns, cps, "o-", color=COLORS["seq"], label="Issuance (parallel batch)", linewidth=2)
-
-if ver and ver.get("concurrent"):
-    ns  = [r["n"] for r in ver["concurrent"]]
-    qps = [r.get("throughput_qps", {}).get("mean", 0) for r in ver["concurrent"]]
-    ax.plot(ns, qps, "s-", color=COLORS["ver"], label="Verification (concurrent)", linewidth=2)
-
-if conc and conc.get("concurrent"):
-    ns  = [r["c"] for r in conc["concurrent"]]
-    ops = [r.get("throughput_ops", {}).get("mean", 0) for r in conc["concurrent"]]
-    ax.plot(ns, ops, "^-", color=COLORS["mix"], label="Mixed workload (30% issue + 70% verify)", linewidth=2)
-
-ax.set_xscale("log"); ax.set_yscale("log")
-ax.set_xlabel("Batch Size / Concurrency Level (N)"); ax.set_ylabel("Throughput (ops/s)")
-ax.set_title("Fig 3 — Operation Throughput vs Scale (IC Mainnet)")
-ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: fmt_n(int(v))))
-ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: f"{v:.0f}"))
-ax.legend()
-savefig(fig, "Fig03_throughput_comparison")
-plt.close(fig)
+def fig03_throughput_comparison(d):
+    plt, ticker = _mpl()
+    print("Fig 03: Throughput comparison …")
+    fig, ax = plt.subplots(figsize=(9, 5))
+
+    if d["iss_par"] is not None:
+        ns, cps, _ = d["iss_par"]
+        ax.plot(ns, cps, "o-", color=COLORS["seq"], label="Issuance (parallel batch)", linewidth=2)
+
+    if d["ver_con"] is not None:
+        ns, qps, _ = d["ver_con"]
+        ax.plot(ns, qps, "s-", color=COLORS["ver"], label="Verification (concurrent)", linewidth=2)
+
+    if d["conc_con"] is not None:
+        cs, ops, _ = d["conc_con"]
+        ax.plot(cs, ops, "^-", color=COLORS["mix"], label="Mixed workload (30% issue + 70% verify)", linewidth=2)
+
+    ax.set_xscale("log"); ax.set_yscale("log")
+    ax.set_xlabel("Batch Size / Concurrency Level (N)"); ax.set_ylabel("Throughput (ops/s)")
+    ax.set_title("Fig 3 — Operation Throughput vs Scale (IC Mainnet)")
+    ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: fmt_n(int(v))))
+    ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: f"{v:.0f}"))
+    ax.legend()
+    savefig(fig, "Fig03_throughput_comparison")
+    plt.close(fig)
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Figure 4  —  Concurrent Users vs Time & Throughput
 # ═════════════════════════════════════════════════════════════════════════════
 
-if conc and conc.get("concurrent"):
+def fig04_concurrent_users(d):
+    if d["conc_con"] is None:
+        return
+    plt, ticker = _mpl()
     print("Fig 04: Concurrent users …")
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
 
-    cs    = [r["c"] for r in conc["concurrent"]]
-    walls = [r.get("wall_ms", {}).get("mean", 0) for r in conc["concurrent"]]
-    ops   = [r.get("throughput_ops", {}).get("mean", 0) for r in conc["concurrent"]]
+    cs, ops, walls = d["conc_con"]
     err_rates = []
-    for r in conc["concurrent"]:
+    for r in d["conc"]["concurrent"]:
         reps = r.get("reps", [])
         if reps:
             err_rates.append(np.mean([rep.get("error_rate", 0) for rep in reps]))
         else:
             err_rates.append(0)
+    err_pct = np.asarray(err_rates) * 100
 
     ax = axes[0]
     ax.plot(cs, walls, "o-", color=COLORS["con"], label="Wall time (ms)")
@@ -281,11 +459,11 @@ if conc and conc.get("concurrent"):
 
     ax = axes[1]
     ax2 = ax.twinx()
-    l1, = ax.plot(cs, ops,       "o-", color=COLORS["con"],   label="Throughput (ops/s)")
-    l2, = ax2.plot(cs, [e*100 for e in err_rates], "s--", color=COLORS["burst"], alpha=0.8, label="Error rate (%)")
+    l1, = ax.plot(cs, ops, "o-", color=COLORS["con"],   label="Throughput (ops/s)")
+    l2, = ax2.plot(cs, err_pct, "s--", color=COLORS["burst"], alpha=0.8, label="Error rate (%)")
     ax.set_xlabel("Simultaneous Callers (C)"); ax.set_ylabel("Throughput (ops/s)", color=COLORS["con"])
     ax2.set_ylabel("Error Rate (%)", color=COLORS["burst"])
-    ax2.set_ylim(0, max(max(e*100 for e in err_rates) * 1.5, 5))
+    ax2.set_ylim(0, max(err_pct.max() * 1.5, 5))
     ax.set_title("Throughput & Error Rate vs Concurrent Users")
     ax.legend(handles=[l1, l2])
 
@@ -297,54 +475,53 @@ if conc and conc.get("concurrent"):
 # Figure 5  —  Latency CDFs
 # ═════════════════════════════════════════════════════════════════════════════
 
-print("Fig 05: Latency CDFs …")
-fig, ax = plt.subplots(figsize=(9, 5))
-
-if iss and iss.get("sequential"):
-    for i, r in enumerate(iss["sequential"]):
-        times = r.get("times_ms", [])
-        if times:
-            x, y = cdf(times)
-            ax.plot(x, y*100, alpha=0.8, label=f"Issuance N={fmt_n(r['n'])}", linestyle="-")
-
-if ver and ver.get("sequential"):
-    for i, r in enumerate(ver["sequential"][:3]):   # first 3 to keep chart readable
-        times = r.get("times_ms", [])
-        if times:
-            x, y = cdf(times)
-            ax.plot(x, y*100, alpha=0.8, label=f"Verification N={fmt_n(r['n'])}", linestyle="--")
-
-ax.axhline(y=50,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
-ax.axhline(y=95,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
-ax.axhline(y=99,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
-ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 51, "p50", fontsize=8, color="grey")
-ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 96, "p95", fontsize=8, color="grey")
-ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 100, "p99", fontsize=8, color="grey")
-
-ax.set_xlabel("Latency (ms)"); ax.set_ylabel("Percentile (%)")
-ax.set_title("Fig 5 — Latency CDF: Issuance vs Verification")
-ax.legend(loc="lower right", fontsize=8)
-ax.set_ylim(0, 100)
-savefig(fig, "Fig05_latency_cdf")
-plt.close(fig)
+def fig05_latency_cdf(d):
+    plt, ticker = _mpl()
+    print("Fig 05: Latency CDFs …")
+    fig, ax = plt.subplots(figsize=(9, 5))
+
+    if d["iss_seq_sorted"]:
+        for r, times in zip(d["iss"]["sequential"], d["iss_seq_sorted"]):
+            if times is not None:
+                x, y = lttb(*cdf(times), CDF_MAX_POINTS)
+                ax.plot(x, y*100, alpha=0.8, label=f"Issuance N={fmt_n(r['n'])}", linestyle="-")
+
+    if d["ver_seq_sorted"]:
+        for r, times in zip(d["ver"]["sequential"][:3], d["ver_seq_sorted"]):   # first 3 to keep chart readable
+            if times is not None:
+                x, y = lttb(*cdf(times), CDF_MAX_POINTS)
+                ax.plot(x, y*100, alpha=0.8, label=f"Verification N={fmt_n(r['n'])}", linestyle="--")
+
+    ax.axhline(y=50,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
+    ax.axhline(y=95,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
+    ax.axhline(y=99,  color="grey", linestyle=":", linewidth=0.8, alpha=0.6)
+    ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 51, "p50", fontsize=8, color="grey")
+    ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 96, "p95", fontsize=8, color="grey")
+    ax.text(ax.get_xlim()[0] if ax.get_xlim()[0] > 0 else 1, 100, "p99", fontsize=8, color="grey")
+
+    ax.set_xlabel("Latency (ms)"); ax.set_ylabel("Percentile (%)")
+    ax.set_title("Fig 5 — Latency CDF: Issuance vs Verification")
+    ax.legend(loc="lower right", fontsize=8)
+    ax.set_ylim(0, 100)
+    savefig(fig, "Fig05_latency_cdf")
+    plt.close(fig)
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Figure 6  —  Merkle Tree Growth
 # ═════════════════════════════════════════════════════════════════════════════
 
-if thr and thr.get("merkle_growth"):
+def fig06_merkle_growth(d):
+    if d["merkle"] is None:
+        return
+    plt, ticker = _mpl()
     print("Fig 06: Merkle tree growth …")
     fig, axes = plt.subplots(1, 2, figsize=(12, 4.5))
-    mg = thr["merkle_growth"]
-    db_sizes   = [r["db_size_after"] for r in mg]
-    cps_vals   = [r["throughput_cps"] for r in mg]
-    wall_vals  = [r["batch_wall_ms"] for r in mg]
-    batch_sizes = [r["batch_size"] for r in mg]
+    db_sizes, cps_vals, wall_vals = d["merkle"]
 
     ax = axes[0]
     ax.plot(db_sizes, wall_vals, "o-", color=COLORS["tree"], label="Batch wall time (ms)")
     # Fit O(N log N) reference line
-    x   = np.array(db_sizes, dtype=float)
+    x   = db_sizes
     ref = x * np.log2(np.maximum(x, 2)) / x[0] * wall_vals[0] if len(x) > 1 else x
     ax.plot(db_sizes, ref, "k--", alpha=0.4, label="O(N log N) reference")
     ax.set_xlabel("Total Certs in Canister"); ax.set_ylabel("Batch Wall Time (ms)")
@@ -369,71 +546,71 @@ if thr and thr.get("merkle_growth"):
 # Figure 7  —  Latency Box Plots
 # ═════════════════════════════════════════════════════════════════════════════
 
-print("Fig 07: Latency box plots …")
-fig, ax = plt.subplots(figsize=(11, 5))
-
-box_data   = []
-box_labels = []
-box_colors = []
-
-if iss and iss.get("sequential"):
-    for r in iss["sequential"]:
-        t = r.get("times_ms", [])
-        if t:
-            box_data.append(t); box_labels.append(f"Issue\nN={fmt_n(r['n'])}"); box_colors.append(COLORS["seq"])
-
-if ver and ver.get("sequential"):
-    for r in ver["sequential"][:4]:
-        t = r.get("times_ms", [])
-        if t:
-            box_data.append(t); box_labels.append(f"Verify\nN={fmt_n(r['n'])}"); box_colors.append(COLORS["ver"])
-
-if box_data:
-    bp = ax.boxplot(box_data, labels=box_labels, patch_artist=True,
-                    medianprops=dict(color="black", linewidth=2),
-                    flierprops=dict(marker="o", markersize=3, alpha=0.3))
-    for patch, color in zip(bp["boxes"], box_colors):
-        patch.set_facecolor(color); patch.set_alpha(0.5)
-    ax.set_yscale("log")
-    ax.set_ylabel("Latency (ms)")
-    ax.set_title("Fig 7 — Latency Distribution: Issuance vs Verification (Box Plots)")
-    ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: f"{v:.0f}"))
-
-savefig(fig, "Fig07_latency_boxplots")
-plt.close(fig)
+def fig07_latency_boxplots(d):
+    plt, ticker = _mpl()
+    print("Fig 07: Latency box plots …")
+    fig, ax = plt.subplots(figsize=(11, 5))
+
+    box_data   = []
+    box_labels = []
+    box_colors = []
+
+    if d["iss_seq_sorted"]:
+        for r, t in zip(d["iss"]["sequential"], d["iss_seq_sorted"]):
+            if t is not None:
+                box_data.append(t); box_labels.append(f"Issue\nN={fmt_n(r['n'])}"); box_colors.append(COLORS["seq"])
+
+    if d["ver_seq_sorted"]:
+        for r, t in zip(d["ver"]["sequential"][:4], d["ver_seq_sorted"]):
+            if t is not None:
+                box_data.append(t); box_labels.append(f"Verify\nN={fmt_n(r['n'])}"); box_colors.append(COLORS["ver"])
+
+    if box_data:
+        bp = ax.boxplot(box_data, labels=box_labels, patch_artist=True,
+                        medianprops=dict(color="black", linewidth=2),
+                        flierprops=dict(marker="o", markersize=3, alpha=0.3))
+        for patch, color in zip(bp["boxes"], box_colors):
+            patch.set_facecolor(color); patch.set_alpha(0.5)
+        ax.set_yscale("log")
+        ax.set_ylabel("Latency (ms)")
+        ax.set_title("Fig 7 — Latency Distribution: Issuance vs Verification (Box Plots)")
+        ax.yaxis.set_major_formatter(ticker.FuncFormatter(lambda v, _: f"{v:.0f}"))
+
+    savefig(fig, "Fig07_latency_boxplots")
+    plt.close(fig)
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Figure 8  —  Throughput Over Time (Sustained benchmark)
 # ═════════════════════════════════════════════════════════════════════════════
 
-if thr and thr.get("sustained"):
+def fig08_throughput_over_time(d):
+    thr = d["thr"]
+    if not (thr and thr.get("sustained")):
+        return
+    plt, ticker = _mpl()
     print("Fig 08: Throughput over time …")
-    sus = thr["sustained"]
     fig, axes = plt.subplots(2, 1, figsize=(11, 7))
 
     # Rolling average of individual latencies over time
-    ts_ms  = sus.get("timestamps_ms", [])
-    lat_ms = sus.get("times_ms", [])
-    if ts_ms and lat_ms:
-        ts_s = [t / 1000 for t in ts_ms]
+    if d["sus_trace"] is not None:
+        ts_s, lat_ms = d["sus_trace"]
         ax   = axes[0]
-        ax.scatter(ts_s, lat_ms, s=3, alpha=0.3, color=COLORS["seq"], label="Individual latency")
+        ax.scatter(ts_s, lat_ms, s=3, alpha=0.3, color=COLORS["seq"], label="Individual latency",
+                   rasterized=len(lat_ms) > RASTERIZE_ABOVE)
         # Rolling mean
         window = 20
-        rolling = [np.mean(lat_ms[max(0, i-window):i+1]) for i in range(len(lat_ms))]
+        rolling = rolling_mean(lat_ms, window)
         ax.plot(ts_s, rolling, color=COLORS["par"], linewidth=2, label=f"Rolling mean (w={window})")
         ax.set_xlabel("Time (s)"); ax.set_ylabel("Issuance Latency (ms)")
         ax.set_title("Per-Operation Latency During 60-Second Sustained Load")
         ax.legend()
 
     # Throughput in 10-second windows
-    windows = sus.get("throughput_windows", [])
-    if windows:
-        w_starts = [w["window_start_s"] for w in windows]
-        w_tps    = [w["throughput_cps"] for w in windows]
+    if d["sus_windows"] is not None:
+        w_starts, w_tps = d["sus_windows"]
         ax = axes[1]
         ax.bar(w_starts, w_tps, width=8, color=COLORS["con"], alpha=0.7, label="Certs/s per 10s window")
-        ax.axhline(y=np.mean(w_tps), color=COLORS["seq"], linestyle="--", linewidth=2, label=f"Mean = {np.mean(w_tps):.2f} certs/s")
+        ax.axhline(y=w_tps.mean(), color=COLORS["seq"], linestyle="--", linewidth=2, label=f"Mean = {w_tps.mean():.2f} certs/s")
         ax.set_xlabel("Time Elapsed (s)"); ax.set_ylabel("Throughput (certs/s)")
         ax.set_title("Throughput in 10-Second Windows During Sustained Load")
         ax.legend()
@@ -447,7 +624,11 @@ if thr and thr.get("sustained"):
 # Figure 9  —  Peak Burst Analysis
 # ═════════════════════════════════════════════════════════════════════════════
 
-if thr and thr.get("peak_burst"):
+def fig09_burst_analysis(d):
+    thr = d["thr"]
+    if not (thr and thr.get("peak_burst")):
+        return
+    plt, ticker = _mpl()
     print("Fig 09: Peak burst …")
     burst = thr["peak_burst"]
     fig, axes = plt.subplots(1, 2, figsize=(10, 4))
@@ -471,9 +652,7 @@ if thr and thr.get("peak_burst"):
     vals   = [lat.get(k, lat.get("median" if k == "median" else k, 0)) for k in keys]
     bars = ax.bar(labels, vals, color=[COLORS["con"]]*3 + [COLORS["par"]] + [COLORS["burst"]]*2, alpha=0.75)
     ax.set_ylabel("Latency (ms)"); ax.set_title("Burst Success Latency Percentiles")
-    for bar, val in zip(bars, vals):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 20,
-                f"{val:.0f}", ha="center", va="bottom", fontsize=8)
+    ax.bar_label(bars, labels=[f"{v:.0f}" for v in vals], padding=2, fontsize=8)
 
     fig.suptitle("Fig 9 — Peak Burst (1000 Simultaneous Calls) Analysis", fontsize=13, fontweight="bold")
     fig.tight_layout()
@@ -484,18 +663,42 @@ if thr and thr.get("peak_burst"):
 # Figure 10  —  ICP Finality Time
 # ═════════════════════════════════════════════════════════════════════════════
 
-if conc and conc.get("finality_ms"):
+def fig10_finality_time(d):
+    conc = d["conc"]
+    if not (conc and conc.get("finality_ms")):
+        return
+    plt, ticker = _mpl()
     print("Fig 10: ICP finality …")
     fin = conc["finality_ms"]
-    samples = fin.get("samples", [])
+    # Raw samples when the runner kept them; current runs store only their count
+    raw = fin.get("samples")
+    samples = np.sort(raw) if isinstance(raw, list) and raw else None
     fig, axes = plt.subplots(1, 2, figsize=(11, 4.5))
 
     ax = axes[0]
-    ax.hist(samples, bins=20, color=COLORS["ver"], alpha=0.7, edgecolor="white")
-    for p, lbl in [(50, "Median"), (95, "p95")]:
-        v = float(np.percentile(samples, p)) if samples else 0
+    if samples is not None:
+        # Sort once; bin edges, counts and both markers all reuse it
+        edges = np.histogram_bin_edges(samples, bins=20)
+        counts, _ = np.histogram(samples, bins=edges)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+               color=COLORS["ver"], alpha=0.7, edgecolor="white")
+        v50, v95 = np.percentile(samples, [50, 95])
+        ax.set_ylabel("Count")
+    else:
+        # Only aggregates were stored: shade the observed range instead of a
+        # histogram, and drop the y-axis since there are no counts to show
+        v50, v95 = fin.get("p50", 0), fin.get("p95", 0)
+        if "min" in fin and "max" in fin:
+            lo, hi = fin["min"], fin["max"]
+            n = f", n={raw}" if isinstance(raw, int) else ""
+            ax.axvspan(lo, hi, color=COLORS["ver"], alpha=0.15, label=f"Min–max {lo:.0f}–{hi:.0f}ms{n}")
+            pad = 0.05 * (hi - lo)
+            ax.set_xlim(lo - pad, hi + pad)
+        ax.set_yticks([])
+        ax.grid(False, axis="y")
+    for v, lbl in [(v50, "Median"), (v95, "p95")]:
         ax.axvline(v, color=COLORS["burst"], linestyle="--", linewidth=1.5, label=f"{lbl}={v:.0f}ms")
-    ax.set_xlabel("Time to Finality (ms)"); ax.set_ylabel("Count")
+    ax.set_xlabel("Time to Finality (ms)")
     ax.set_title("ICP Finality Time Distribution\n(submit → cert readable via query)")
     ax.legend()
 
@@ -508,81 +711,110 @@ if conc and conc.get("finality_ms"):
     ax.set_yscale("log")
     ax.set_ylabel("Finality Time (ms, log scale)")
     ax.set_title("Finality Time: ICP vs Other Blockchains\n(reference values)")
-    for bar, val in zip(bars, chain_vals):
-        ax.text(bar.get_x() + bar.get_width()/2, val*1.1,
-                f"{val:.0f}ms" if val < 10000 else f"{val/1000:.0f}s",
-                ha="center", va="bottom", fontsize=8, fontweight="bold")
+    ax.bar_label(bars, labels=[f"{v:.0f}ms" if v < 10000 else f"{v/1000:.0f}s" for v in chain_vals],
+                 padding=2, fontsize=8, fontweight="bold")
 
     fig.suptitle("Fig 10 — ICP Consensus Finality Time", fontsize=13, fontweight="bold", y=1.01)
     savefig(fig, "Fig10_finality_time")
     plt.close(fig)
 
+FIGURES = [
+    fig01_issuance_latency,
+    fig02_verification_latency,
+    fig03_throughput_comparison,
+    fig04_concurrent_users,
+    fig05_latency_cdf,
+    fig06_merkle_growth,
+    fig07_latency_boxplots,
+    fig08_throughput_over_time,
+    fig09_burst_analysis,
+    fig10_finality_time,
+]
+
 # ═════════════════════════════════════════════════════════════════════════════
 # LaTeX Summary Table
 # ═════════════════════════════════════════════════════════════════════════════
 
-print("\nGenerating LaTeX summary table …")
-tex_rows = []
-tex_rows.append(r"\begin{table}[htbp]")
-tex_rows.append(r"\centering")
-tex_rows.append(r"\caption{ICP Academic Credential Verification — Mainnet Performance Summary}")
-tex_rows.append(r"\label{tab:perf_summary}")
-tex_rows.append(r"\begin{tabular}{llrrrr}")
-tex_rows.append(r"\toprule")
-tex_rows.append(r"Operation & Mode & N & Mean (ms) & p95 (ms) & Throughput (ops/s) \\")
-tex_rows.append(r"\midrule")
-
-if iss and iss.get("sequential"):
-    for r in iss["sequential"]:
-        tex_rows.append(
-            f"Issuance & Sequential & {fmt_n(r['n'])} & "
-            f"{r.get('mean',0):.0f} & {r.get('p95',0):.0f} & "
-            f"{round(1000/max(r.get('mean',1),1),2)} \\\\"
-        )
-
-if iss and iss.get("parallel"):
-    for r in iss["parallel"]:
-        cps = r.get("throughput_cps", {})
-        tex_rows.append(
-            f"Issuance & Parallel & {fmt_n(r['n'])} & "
-            f"{r.get('individual_ms',{}).get('mean',0):.0f} & "
-            f"{r.get('individual_ms',{}).get('p95',0):.0f} & "
-            f"{cps.get('mean',0):.1f} \\\\"
-        )
-
-tex_rows.append(r"\midrule")
-
-if ver and ver.get("sequential"):
-    for r in ver["sequential"]:
-        tex_rows.append(
-            f"Verification & Sequential & {fmt_n(r['n'])} & "
-            f"{r.get('mean',0):.0f} & {r.get('p95',0):.0f} & "
-            f"{round(1000/max(r.get('mean',1),1),2)} \\\\"
-        )
-
-if ver and ver.get("concurrent"):
-    for r in ver["concurrent"]:
-        qps = r.get("throughput_qps", {})
-        tex_rows.append(
-            f"Verification & Concurrent & {fmt_n(r['n'])} & "
-            f"{r.get('individual_ms',{}).get('mean',0):.0f} & "
-            f"{r.get('individual_ms',{}).get('p95',0):.0f} & "
-            f"{qps.get('mean',0):.1f} \\\\"
-        )
-
-tex_rows.append(r"\bottomrule")
-tex_rows.append(r"\end{tabular}")
-tex_rows.append(r"\end{table}")
-
-tex_path = FIGURES_DIR / "summary_table.tex"
-tex_path.write_text("\n".join(tex_rows))
-print(f"  Saved: figures/summary_table.tex")
+# Static skeleton; each $..._rows block is zero or more newline-terminated rows.
+LATEX_TABLE = Template(r"""\begin{table}[htbp]
+\centering
+\caption{ICP Academic Credential Verification — Mainnet Performance Summary}
+\label{tab:perf_summary}
+\begin{tabular}{llrrrr}
+\toprule
+Operation & Mode & N & Mean (ms) & p95 (ms) & Throughput (ops/s) \\
+\midrule
+${issuance_rows}\midrule
+${verification_rows}\bottomrule
+\end{tabular}
+\end{table}""")
+
+def write_latex_table(d):
+    iss, ver = d["iss"], d["ver"]
+    print("\nGenerating LaTeX summary table …")
+    iss_rows, ver_rows = [], []
+
+    if iss and iss.get("sequential"):
+        for r in iss["sequential"]:
+            iss_rows.append(
+                f"Issuance & Sequential & {fmt_n(r['n'])} & "
+                f"{r.get('mean',0):.0f} & {r.get('p95',0):.0f} & "
+                f"{round(1000/max(r.get('mean',1),1),2)} \\\\"
+            )
+
+    if iss and iss.get("parallel"):
+        for r in iss["parallel"]:
+            cps = r.get("throughput_cps", {})
+            iss_rows.append(
+                f"Issuance & Parallel & {fmt_n(r['n'])} & "
+                f"{r.get('individual_ms',{}).get('mean',0):.0f} & "
+                f"{r.get('individual_ms',{}).get('p95',0):.0f} & "
+                f"{cps.get('mean',0):.1f} \\\\"
+            )
+
+    if ver and ver.get("sequential"):
+        for r in ver["sequential"]:
+            ver_rows.append(
+                f"Verification & Sequential & {fmt_n(r['n'])} & "
+                f"{r.get('mean',0):.0f} & {r.get('p95',0):.0f} & "
+                f"{round(1000/max(r.get('mean',1),1),2)} \\\\"
+            )
+
+    if ver and ver.get("concurrent"):
+        for r in ver["concurrent"]:
+            qps = r.get("throughput_qps", {})
+            ver_rows.append(
+                f"Verification & Concurrent & {fmt_n(r['n'])} & "
+                f"{r.get('individual_ms',{}).get('mean',0):.0f} & "
+                f"{r.get('individual_ms',{}).get('p95',0):.0f} & "
+                f"{qps.get('mean',0):.1f} \\\\"
+            )
+
+    tex = LATEX_TABLE.substitute(issuance_rows="".join(r + "\n" for r in iss_rows),
+                                 verification_rows="".join(r + "\n" for r in ver_rows))
+
+    tex_path = FIGURES_DIR / "summary_table.tex"
+    # Leave the file (and its mtime) alone when nothing changed, so a LaTeX
+    # build that \input's it is not needlessly re-run.
+    if write_if_changed(tex_path, tex):
+        print(f"  Saved: figures/summary_table.tex")
+    else:
+        print(f"  Unchanged: figures/summary_table.tex")
 
 # ═════════════════════════════════════════════════════════════════════════════
 # Interactive HTML Dashboard (Plotly)
 # ═════════════════════════════════════════════════════════════════════════════
 
-if HAS_PLOTLY:
+def write_dashboard(d):
+    try:
+        import plotly.graph_objects as go
+        import plotly.offline as po
+        import plotly.subplots as psp
+    except ImportError:
+        print("  (Plotly not installed — skipping HTML dashboard. Run: pip install plotly)")
+        return
+
+    conc, thr = d["conc"], d["thr"]
     print("Generating interactive HTML dashboard …")
     fig_html = psp.make_subplots(
         rows=3, cols=3,
@@ -601,39 +833,32 @@ if HAS_PLOTLY:
     )
 
     # Row 1 Col 1: Sequential issuance
-    if iss and iss.get("sequential"):
-        ns   = [r["n"] for r in iss["sequential"]]
-        mns  = [r.get("mean", 0) for r in iss["sequential"]]
-        p95s = [r.get("p95", 0) for r in iss["sequential"]]
+    if d["iss_seq"] is not None:
+        ns, mns, _, p95s, _ = d["iss_seq"]
         fig_html.add_trace(go.Scatter(x=ns, y=mns, mode="lines+markers", name="Mean", line=dict(color=COLORS["seq"])), 1, 1)
         fig_html.add_trace(go.Scatter(x=ns, y=p95s, mode="lines+markers", name="p95", line=dict(color=COLORS["par"], dash="dash")), 1, 1)
 
     # Row 1 Col 2: Parallel issuance throughput
-    if iss and iss.get("parallel"):
-        ns  = [r["n"] for r in iss["parallel"]]
-        cps = [r.get("throughput_cps", {}).get("mean", 0) for r in iss["parallel"]]
+    if d["iss_par"] is not None:
+        ns, cps, _ = d["iss_par"]
         fig_html.add_trace(go.Scatter(x=ns, y=cps, mode="lines+markers", name="Certs/s", line=dict(color=COLORS["par"])), 1, 2)
 
     # Row 1 Col 3: Concurrent verification throughput
-    if ver and ver.get("concurrent"):
-        ns  = [r["n"] for r in ver["concurrent"]]
-        qps = [r.get("throughput_qps", {}).get("mean", 0) for r in ver["concurrent"]]
+    if d["ver_con"] is not None:
+        ns, qps, _ = d["ver_con"]
         fig_html.add_trace(go.Scatter(x=ns, y=qps, mode="lines+markers", name="Queries/s", line=dict(color=COLORS["ver"])), 1, 3)
 
     # Row 2 Col 1: Throughput comparison
-    if iss and iss.get("parallel"):
-        ns  = [r["n"] for r in iss["parallel"]]
-        cps = [r.get("throughput_cps", {}).get("mean", 0) for r in iss["parallel"]]
+    if d["iss_par"] is not None:
+        ns, cps, _ = d["iss_par"]
         fig_html.add_trace(go.Scatter(x=ns, y=cps, mode="lines+markers", name="Issuance parallel", line=dict(color=COLORS["seq"])), 2, 1)
-    if ver and ver.get("concurrent"):
-        ns  = [r["n"] for r in ver["concurrent"]]
-        qps = [r.get("throughput_qps", {}).get("mean", 0) for r in ver["concurrent"]]
+    if d["ver_con"] is not None:
+        ns, qps, _ = d["ver_con"]
         fig_html.add_trace(go.Scatter(x=ns, y=qps, mode="lines+markers", name="Verification concurrent", line=dict(color=COLORS["ver"])), 2, 1)
 
     # Row 2 Col 2: Concurrent users vs throughput
-    if conc and conc.get("concurrent"):
-        cs  = [r["c"] for r in conc["concurrent"]]
-        ops = [r.get("throughput_ops", {}).get("mean", 0) for r in conc["concurrent"]]
+    if d["conc_con"] is not None:
+        cs, ops, _ = d["conc_con"]
         fig_html.add_trace(go.Scatter(x=cs, y=ops, mode="lines+markers", name="Mixed ops/s", line=dict(color=COLORS["mix"])), 2, 2)
 
     # Row 2 Col 3: Finality percentile bar chart (raw samples not stored, use aggregate stats)
@@ -648,23 +873,20 @@ if HAS_PLOTLY:
             ), 2, 3)
 
     # Row 3 Col 1: Merkle tree
-    if thr and thr.get("merkle_growth"):
-        mg = thr["merkle_growth"]
+    if d["merkle"] is not None:
+        db_sizes, _, wall_vals = d["merkle"]
         fig_html.add_trace(go.Scatter(
-            x=[r["db_size_after"] for r in mg],
-            y=[r["batch_wall_ms"] for r in mg],
+            x=db_sizes, y=wall_vals,
             mode="lines+markers", name="Rebuild time (ms)", line=dict(color=COLORS["tree"])
         ), 3, 1)
 
     # Row 3 Col 2: Throughput over time
-    if thr and thr.get("sustained"):
-        wins = thr["sustained"].get("throughput_windows", [])
-        if wins:
-            fig_html.add_trace(go.Bar(
-                x=[w["window_start_s"] for w in wins],
-                y=[w["throughput_cps"] for w in wins],
-                name="Certs/s (10s window)", marker_color=COLORS["con"]
-            ), 3, 2)
+    if d["sus_windows"] is not None:
+        w_starts, w_tps = d["sus_windows"]
+        fig_html.add_trace(go.Bar(
+            x=w_starts, y=w_tps,
+            name="Certs/s (10s window)", marker_color=COLORS["con"]
+        ), 3, 2)
 
     # Row 3 Col 3: Burst
     if thr and thr.get("peak_burst"):
@@ -684,21 +906,80 @@ if HAS_PLOTLY:
         template="plotly_white",
     )
     dash_path = FIGURES_DIR / "dashboard.html"
-    fig_html.write_html(str(dash_path))
-    print(f"  Saved: figures/dashboard.html")
-else:
-    print("  (Plotly not installed — skipping HTML dashboard. Run: pip install plotly)")
-
-# ── Done ──────────────────────────────────────────────────────────────────────
-
-print(f"""
-==========================================
-  All figures saved to: benchmarks/visualize/figures/
+    # Keep the ~4.8 MB plotly.js bundle out of the HTML: both files are tracked,
+    # and the page loads the bundle by relative path, so it also works offline.
+    # Rewrite the bundle whenever it differs from the installed plotly's --
+    # an older plotly.js cannot decode the base64 typed arrays newer plotly
+    # emits for ndarray traces.
+    write_if_changed(FIGURES_DIR / "plotly.min.js", po.get_plotlyjs())
+    fig_html.write_html(str(dash_path), include_plotlyjs="plotly.min.js")
+    print(f"  Saved: figures/dashboard.html  (+ plotly.min.js)")
+
+# ── main ──────────────────────────────────────────────────────────────────────
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate paper figures, the LaTeX summary table and the HTML dashboard.")
+    ap.add_argument("--only", default=",".join(OUTPUTS),
+                    help=f"comma-separated subset of outputs to build: {','.join(OUTPUTS)} (default: all)")
+    ap.add_argument("--draft", action="store_true",
+                    help=f"quick-look PNGs: {DRAFT_PNG_DPI} dpi, fast compression (PDFs unchanged)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="worker processes for the figures; 1 renders in-process (default: CPU count)")
+    args = ap.parse_args(argv)
+    if args.jobs < 1:
+        ap.error("--jobs must be at least 1")
+    only = {o.strip() for o in args.only.split(",") if o.strip()}
+    unknown = only - set(OUTPUTS)
+    if unknown:
+        ap.error(f"--only: unknown output(s): {', '.join(sorted(unknown))}")
+    if not only:
+        ap.error(f"--only: select at least one of {','.join(OUTPUTS)}")
+
+    d = load_suites()
+    available = [k for k in ("iss", "ver", "conc", "thr") if d[k]]
+    print(f"\nLoaded benchmark files: {available}")
+    if not available:
+        print("ERROR: No result JSON files found in benchmarks/results/")
+        print("Run: node benchmarks/run.js  first.")
+        sys.exit(1)
+    shared_series(d)
+
+    if "figures" in only:
+        # Figures are independent and CPU-bound in Matplotlib, so render them
+        # in worker processes; each worker imports its own Agg backend.  With
+        # a single job the pool is pure overhead (spawn + pickling d per task).
+        _mpl()   # import once here so forked workers inherit pyplot + font cache
+        if args.jobs == 1:
+            _init_worker(args.draft)
+            for fig_fn in FIGURES:
+                fig_fn(d)
+        else:
+            # No more workers than figures, or the extras just idle
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(FIGURES)), initializer=_init_worker,
+                                     initargs=(args.draft,)) as ex:
+                for fut in [ex.submit(fig_fn, d) for fig_fn in FIGURES]:
+                    fut.result()
+    if "table" in only:
+        write_latex_table(d)
+    if "dashboard" in only:
+        write_dashboard(d)
+
+    # ── Done ──────────────────────────────────────────────────────────────────
+    print("""
 ==========================================
-  PNG + PDF : 9 publication-ready figures
-  LaTeX     : figures/summary_table.tex
-  HTML      : figures/dashboard.html  (if Plotly installed)
-
+  Outputs saved to: benchmarks/visualize/figures/
+==========================================""")
+    if "figures" in only:
+        print(f"  PNG + PDF : {len(FIGURES)} publication-ready figures")
+    if "table" in only:
+        print("  LaTeX     : figures/summary_table.tex")
+    if "dashboard" in only:
+        print("  HTML      : figures/dashboard.html  (if Plotly installed)")
+    if "table" in only:
+        print("""
 Include in your paper:
-  \\input{{benchmarks/visualize/figures/summary_table}}
-""")
+  \\input{benchmarks/visualize/figures/summary_table}""")
+    print()
+
+if __name__ == "__main__":
+    main()